@@ -361,7 +361,7 @@ export class StandaloneServer {
         isrc?: string;
       };
 
-      console.log('[Stream] Resolve request:', { trackId, title, artist, isrc });
+      request.log.info({ trackId, title, artist, isrc }, '[Stream] Resolve request');
 
       if (!trackId && !title) {
         return reply.code(400).send({ error: 'trackId or title required' });
@@ -382,16 +382,13 @@ export class StandaloneServer {
           }
         };
 
-        console.log('[Stream] Calling trackResolver for:', track.title, 'by', track.artists[0]?.name);
         const stream = await this.trackResolver.resolveStream(track as any);
 
         if (!stream) {
-          console.log('[Stream] No stream found');
+          request.log.info({ trackId, title }, '[Stream] No stream found');
           return reply.code(404).send({ error: 'No stream found' });
         }
 
-        console.log('[Stream] Stream resolved:', stream.url?.slice(0, 50) + '...');
-
         // Return stream info with proxied URL
         const proxyUrl = `/api/stream/proxy?url=${encodeURIComponent(stream.url)}`;
         return {
@@ -414,8 +411,6 @@ export class StandaloneServer {
       }
 
       try {
-        console.log('[StreamProxy] Proxying:', url.slice(0, 80) + '...');
-
         // Fetch the audio stream
         const response = await fetch(url, {
           headers: {